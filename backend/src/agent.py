@@ -1,3 +1,4 @@
+import asyncio
 import logging
 
 from dotenv import load_dotenv
@@ -100,14 +101,30 @@ async def entrypoint(ctx: JobContext):
 
     # Metrics collection, to measure pipeline performance
     # For more information, see https://docs.livekit.io/agents/build/metrics/
+    # Events are only queued from the callback; a single long-lived task does the
+    # logging and aggregation so it stays off the event emit path.
     usage_collector = metrics.UsageCollector()
+    metrics_queue: asyncio.Queue[metrics.AgentMetrics] = asyncio.Queue()
+
+    def _record_metrics(agent_metrics: metrics.AgentMetrics):
+        metrics.log_metrics(agent_metrics)
+        usage_collector.collect(agent_metrics)
+
+    async def _drain_metrics():
+        while True:
+            _record_metrics(await metrics_queue.get())
+
+    metrics_task = asyncio.create_task(_drain_metrics())
 
     @session.on("metrics_collected")
     def _on_metrics_collected(ev: MetricsCollectedEvent):
-        metrics.log_metrics(ev.metrics)
-        usage_collector.collect(ev.metrics)
+        metrics_queue.put_nowait(ev.metrics)
 
     async def log_usage():
+        metrics_task.cancel()
+        while not metrics_queue.empty():
+            _record_metrics(metrics_queue.get_nowait())
+
         summary = usage_collector.get_summary()
         logger.info(f"Usage: {summary}")
 